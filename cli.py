@@ -1,15 +1,31 @@
 import argparse
 import json
 import asyncio
-from main import StressTestMetrics, LoadProfile
+from main import StressTestMetrics, LoadProfile, ClientMonitor, ExemplarReservoir, StartGate, build_exemplar, preconnect
 import aiohttp
 import time
+import numpy as np
+from collections import deque
 from datetime import datetime
 import sys
 import signal
 import validators
-from typing import Optional
+from typing import Dict, List, Optional
 import os
+import re
+import gzip
+import errno
+import socket
+from contextlib import AsyncExitStack, nullcontext, redirect_stdout
+from itertools import cycle
+from urllib.parse import urlsplit
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import DefaultResolver
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 class GracefulExit(SystemExit):
     pass
@@ -26,6 +42,24 @@ def validate_positive(value: str) -> int:
         raise argparse.ArgumentTypeError(f"{value} must be positive")
     return ivalue
 
+def validate_non_negative(value: str) -> int:
+    ivalue = int(value)
+    if ivalue < 0:
+        raise argparse.ArgumentTypeError(f"{value} must not be negative")
+    return ivalue
+
+def validate_positive_float(value: str) -> float:
+    fvalue = float(value)
+    if fvalue <= 0:
+        raise argparse.ArgumentTypeError(f"{value} must be positive")
+    return fvalue
+
+def validate_non_negative_float(value: str) -> float:
+    fvalue = float(value)
+    if fvalue < 0:
+        raise argparse.ArgumentTypeError(f"{value} must not be negative")
+    return fvalue
+
 def validate_method(value: str) -> str:
     valid_methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD']
     if value.upper() not in valid_methods:
@@ -33,85 +67,534 @@ def validate_method(value: str) -> str:
     return value.upper()
 
 class ProgressBar:
-    def __init__(self, duration: int):
+    """Reports test progress at a fixed rate from aggregated snapshots.
+
+    Workers never touch the terminal; a single reporter task samples the
+    metrics every `interval` seconds and keeps per-refresh histogram bucket
+    deltas for the last `window` seconds, so the rolling rps/p99 view costs
+    the same at any request rate.
+    """
+
+    MODES = ['bar', 'ndjson', 'none']
+
+    def __init__(self, duration: float, interval: float = 0.5, window: float = 10.0, mode: str = 'bar', stream=None):
         self.duration = duration
+        self.stream = stream or sys.stdout
+        self.interval = interval
+        self.window = window
+        self.mode = mode
         self.start_time = time.time()
+        self.running = False
+        self.last_counts: Dict[int, int] = {}
+        self.last_epoch = None
+        self.samples = deque()
+
+    def snapshot(self, metrics: StressTestMetrics) -> dict:
+        now = time.time()
+        if metrics.epoch != self.last_epoch:
+            self.last_epoch = metrics.epoch
+            self.last_counts = {}
+            self.samples.clear()
+        metrics.fold_histogram()
+        counts = {
+            index: count - self.last_counts.get(index, 0)
+            for index, count in metrics.histogram_counts.items()
+            if count != self.last_counts.get(index, 0)
+        }
+        self.last_counts = dict(metrics.histogram_counts)
+        total = metrics.success_count + metrics.error_count
+
+        self.samples.append((now, total, counts))
+        while len(self.samples) > 1 and now - self.samples[0][0] > self.window:
+            self.samples.popleft()
+
+        window_start, window_total, _ = self.samples[0]
+        window_elapsed = now - window_start
+        window_counts: Dict[int, int] = {}
+        for _, _, sample_counts in self.samples:
+            for index, count in sample_counts.items():
+                window_counts[index] = window_counts.get(index, 0) + count
+        window_histogram = {
+            'min': StressTestMetrics.HISTOGRAM_MIN,
+            'growth': StressTestMetrics.HISTOGRAM_GROWTH,
+            'counts': window_counts
+        }
+        elapsed = now - self.start_time
+        measured = metrics.get_duration()
+
+        return {
+            'elapsed': round(elapsed, 3),
+            'phase': 'warmup' if metrics.in_warmup else 'steady',
+            'requests': total,
+            'errors': metrics.error_count,
+            'success_rate': metrics.success_count / total * 100 if total > 0 else 0,
+            'rps': total / measured if measured > 0 else 0,
+            'window_rps': (total - window_total) / window_elapsed if window_elapsed > 0 else 0,
+            'window_p99': StressTestMetrics.histogram_percentile(window_histogram, 99)
+        }
 
     def update(self, metrics: StressTestMetrics):
-        elapsed = int(time.time() - self.start_time)
-        remaining = max(0, self.duration - elapsed)
-        bar_len = 40
-        filled = int(bar_len * elapsed / self.duration)
-        bar = '=' * filled + '-' * (bar_len - filled)
-        
-        sys.stdout.write('\r')
-        sys.stdout.write(f'Progress: [{bar}] {elapsed}/{self.duration}s | ')
-        sys.stdout.write(f'Requests: {metrics.success_count + metrics.error_count} | ')
-        sys.stdout.write(f'Success Rate: {(metrics.success_count/(metrics.success_count + metrics.error_count)*100 if metrics.success_count + metrics.error_count > 0 else 0):.1f}%')
-        sys.stdout.flush()
+        stats = self.snapshot(metrics)
+        if self.mode == 'ndjson':
+            self.stream.write(json.dumps({'type': 'progress', **stats}) + '\n')
+        elif self.mode == 'bar':
+            elapsed = min(int(stats['elapsed']), int(self.duration))
+            bar_len = 40
+            filled = int(bar_len * elapsed / self.duration)
+            bar = '=' * filled + '-' * (bar_len - filled)
+            label = 'Warm-up' if stats['phase'] == 'warmup' else 'Progress'
+            self.stream.write(
+                f'\r{label}: [{bar}] {elapsed}/{self.duration:g}s | '
+                f'Requests: {stats["requests"]} | '
+                f'Success Rate: {stats["success_rate"]:.1f}% | '
+                f'{stats["window_rps"]:.1f} req/s | '
+                f'P99 ({self.window:g}s): {stats["window_p99"]*1000:.1f}ms'
+            )
+        else:
+            return
+        self.stream.flush()
+
+    def stop(self):
+        self.running = False
+
+    async def run(self, metrics: StressTestMetrics):
+        self.running = True
+        self.start_time = time.time()
+        while self.running:
+            await asyncio.sleep(self.interval)
+            self.update(metrics)
+
+class AccessLogReader:
+    """Lazily yields request entries from an access log.
+
+    Lines are parsed as NDJSON objects or common/combined log format and the
+    file is streamed, so logs of any size can be replayed. Lines that cannot
+    be parsed are skipped and counted.
+    """
+
+    CLF_PATTERN = re.compile(
+        r'\S+ \S+ \S+ \[(?P<time>[^\]]+)\] "(?P<method>[A-Z]+) (?P<target>\S+)[^"]*" \d{3} \S+'
+    )
+
+    def __init__(self, path: str):
+        self.path = path
+        self.skipped = 0
+
+    def parse_line(self, line: str) -> Optional[dict]:
+        line = line.strip()
+        if not line:
+            return None
+        if line.startswith('{'):
+            record = json.loads(line)
+            ts = record.get('timestamp', record.get('time'))
+            timestamp = float(ts) if isinstance(ts, (int, float)) else datetime.fromisoformat(ts).timestamp()
+            entry = {
+                'timestamp': timestamp,
+                'method': record.get('method', 'GET').upper(),
+                'target': record.get('path') or record['url'],
+                'headers': record.get('headers'),
+                'body': record.get('body')
+            }
+        else:
+            match = self.CLF_PATTERN.match(line)
+            if not match:
+                return None
+            entry = {
+                'timestamp': datetime.strptime(match['time'], '%d/%b/%Y:%H:%M:%S %z').timestamp(),
+                'method': match['method'],
+                'target': match['target'],
+                'headers': None,
+                'body': None
+            }
+
+        parts = urlsplit(entry.pop('target'))
+        entry['path'] = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+        return entry
+
+    def __iter__(self):
+        opener = gzip.open if self.path.endswith('.gz') else open
+        with opener(self.path, 'rt') as f:
+            for line in f:
+                try:
+                    entry = self.parse_line(line)
+                except (ValueError, KeyError, TypeError):
+                    entry = None
+                if entry is None:
+                    if line.strip():
+                        self.skipped += 1
+                    continue
+                yield entry
+
+class PinnedResolver(AbstractResolver):
+    """Resolves each host once and serves the pinned addresses for the rest of the test."""
+
+    def __init__(self):
+        self.resolver = DefaultResolver()
+        self.cache = {}
+
+    async def resolve(self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET):
+        key = (host, port, family)
+        if key not in self.cache:
+            self.cache[key] = await self.resolver.resolve(host, port, family)
+        return self.cache[key]
+
+    async def pin(self, url: str) -> List[str]:
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        results = await self.resolve(parts.hostname, port, socket.AF_UNSPEC)
+        return [result['host'] for result in results]
+
+    async def close(self):
+        await self.resolver.close()
+
+def make_socket_factory(reuse_addr: bool):
+    def socket_factory(addr_info):
+        family, type_, proto, _, _ = addr_info
+        sock = socket.socket(family=family, type=type_, proto=proto)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if reuse_addr:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        return sock
+    return socket_factory
+
+def build_connector(args, index: int = 0, resolver: Optional[AbstractResolver] = None) -> aiohttp.TCPConnector:
+    options = {'socket_factory': make_socket_factory(args.reuse_addr)}
+    if args.source_addresses:
+        options['local_addr'] = (args.source_addresses[index % len(args.source_addresses)], 0)
+    if resolver:
+        options['resolver'] = resolver
+    return aiohttp.TCPConnector(
+        limit=args.pool_size,
+        ttl_dns_cache=300,
+        force_close=False,
+        **options
+    )
+
+def error_name(e: Exception) -> str:
+    if isinstance(e, OSError) and e.errno in errno.errorcode:
+        return f"{type(e).__name__} ({errno.errorcode[e.errno]})"
+    return type(e).__name__
+
+def read_port_range() -> Optional[tuple]:
+    try:
+        with open('/proc/sys/net/ipv4/ip_local_port_range') as f:
+            low, high = map(int, f.read().split())
+        return low, high
+    except (OSError, ValueError):
+        return None
+
+def count_time_wait() -> Optional[int]:
+    count = None
+    for path in ('/proc/net/tcp', '/proc/net/tcp6'):
+        try:
+            with open(path) as f:
+                next(f, None)
+                # Fourth column is the socket state; 06 is TIME_WAIT
+                waiting = sum(1 for line in f if line.split()[3] == '06')
+        except OSError:
+            continue
+        count = (count or 0) + waiting
+    return count
+
+def check_source_address(address: str) -> Optional[str]:
+    """Binds a throwaway socket to the address; returns the error if it cannot be used."""
+    try:
+        infos = socket.getaddrinfo(address, 0, type=socket.SOCK_STREAM, flags=socket.AI_NUMERICHOST)
+        family, type_, proto, _, sockaddr = infos[0]
+        with socket.socket(family, type_, proto) as sock:
+            sock.bind(sockaddr)
+    except (OSError, IndexError) as e:
+        return str(e)
+    return None
+
+def preflight(args) -> tuple:
+    """Checks OS resource limits for the requested concurrency, raising the fd limit where allowed.
+
+    Returns (warnings, errors); errors mean the test cannot run as configured.
+    """
+    warnings = []
+    errors = []
+    for address in args.source_addresses or []:
+        error = check_source_address(address)
+        if error:
+            errors.append(f"Cannot bind to source address {address}: {error}")
+
+    connections = args.threads
+    needed_fds = connections + 64
+
+    if resource:
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft != resource.RLIM_INFINITY and soft < needed_fds:
+            target = needed_fds if hard == resource.RLIM_INFINITY else min(needed_fds, hard)
+            try:
+                resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+                print(f"Raised open file limit from {soft} to {target}")
+                soft = target
+            except (ValueError, OSError) as e:
+                warnings.append(f"Could not raise open file limit: {str(e)}")
+            if soft < needed_fds:
+                warnings.append(
+                    f"Open file limit {soft} is below the ~{needed_fds} descriptors needed; "
+                    f"expect EMFILE errors (raise the hard limit with 'ulimit -Hn')"
+                )
+
+    port_range = read_port_range()
+    if port_range:
+        ports = (port_range[1] - port_range[0] + 1) * max(1, len(args.source_addresses or []))
+        if connections > ports:
+            warnings.append(
+                f"{connections} connections exceed the {ports} available ephemeral ports; "
+                f"expect EADDRNOTAVAIL errors (add --source-address or widen net.ipv4.ip_local_port_range)"
+            )
+        time_wait = count_time_wait()
+        if time_wait is not None and time_wait > ports // 2:
+            warnings.append(
+                f"{time_wait} sockets in TIME_WAIT use over half of the ephemeral port range; "
+                f"wait for them to expire or enable net.ipv4.tcp_tw_reuse"
+            )
+
+    return warnings, errors
+
+def build_trace_config() -> aiohttp.TraceConfig:
+    """Records DNS and connect timestamps and connection reuse into each request's trace context."""
+    trace_config = aiohttp.TraceConfig()
+
+    def mark(name):
+        async def callback(session, ctx, params):
+            if ctx.trace_request_ctx is not None:
+                ctx.trace_request_ctx[name] = time.time()
+        return callback
+
+    trace_config.on_dns_resolvehost_start.append(mark('dns_start'))
+    trace_config.on_dns_resolvehost_end.append(mark('dns_end'))
+    trace_config.on_connection_create_start.append(mark('connect_start'))
+    trace_config.on_connection_create_end.append(mark('connect_end'))
+    trace_config.on_connection_reuseconn.append(mark('reused'))
+    return trace_config
+
+async def timed_request(session: aiohttp.ClientSession, metrics: StressTestMetrics, method: str, url: str,
+                        trace: bool = False, **kwargs):
+    trace_ctx = {} if trace else None
+    start_time = time.time()
+    async with session.request(method, url, trace_request_ctx=trace_ctx, **kwargs) as response:
+        headers_time = time.time()
+        body = await response.read()
+        end_time = time.time()
+        response_time = end_time - start_time
+
+        metrics.add_response_time(response_time)
+        if response.status < 400:
+            metrics.success_count += 1
+        else:
+            metrics.add_error(f"HTTP {response.status}")
+
+        if metrics.exemplars.wants(response_time):
+            metrics.exemplars.add(response_time, build_exemplar(
+                method, url, response.status, start_time, headers_time, end_time, len(body), trace_ctx
+            ))
+
+async def replay_log(args, metrics: StressTestMetrics, gate: StartGate, setup: dict,
+                     resolver: Optional[AbstractResolver] = None):
+    """Replays an access log against args.url, preserving inter-arrival gaps scaled by args.speed."""
+    loop = asyncio.get_running_loop()
+    reader = AccessLogReader(args.replay)
+    base_url = args.url.rstrip('/')
+    slots = asyncio.Semaphore(args.threads)
+    in_flight = set()
+
+    async def send(session, entry):
+        body = entry['body']
+        payload = {'json': body} if isinstance(body, (dict, list)) else {'data': body}
+        try:
+            await timed_request(session, metrics, entry['method'], base_url + entry['path'],
+                                trace=args.trace_connections, headers=entry['headers'], **payload)
+        except Exception as e:
+            metrics.add_error(error_name(e))
+        finally:
+            slots.release()
+
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+    trace_configs = [build_trace_config()] if args.trace_connections else None
+
+    async with AsyncExitStack() as stack:
+        # One session per source address so replayed requests spread across them
+        sessions = [
+            await stack.enter_async_context(aiohttp.ClientSession(
+                connector=build_connector(args, index, resolver), timeout=timeout, trace_configs=trace_configs
+            ))
+            for index in range(max(1, len(args.source_addresses or [])))
+        ]
+        session_cycle = cycle(sessions)
+        try:
+            if args.preconnect:
+                per_session = -(-args.preconnect // len(sessions))
+                for session in sessions:
+                    setup['requested'] += per_session
+                    established = await preconnect(session, args.url, per_session)
+                    setup['established'] += established
+            await gate.wait()
+
+            start = first_timestamp = None
+            last_offset = 0.0
+            for entry in reader:
+                if start is None:
+                    start, first_timestamp = loop.time(), entry['timestamp']
+                # Logs are written on completion, so entries can be slightly out of order
+                offset = max((entry['timestamp'] - first_timestamp) / args.speed, last_offset)
+                if offset > args.warmup + args.duration:
+                    break
+                last_offset = offset
+
+                delay = start + offset - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await slots.acquire()
+                metrics.add_schedule_lag(max(0.0, loop.time() - start - offset))
+
+                task = asyncio.create_task(send(next(session_cycle), entry))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+            if start is None:
+                raise ValueError(f"No replayable entries in {args.replay}")
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            gate.leave()
+            if reader.skipped:
+                print(f"\nSkipped {reader.skipped} unparseable log lines")
 
-async def run_stress_test(args) -> Optional[StressTestMetrics]:
+async def run_stress_test(args, progress_stream=None) -> Optional[StressTestMetrics]:
     metrics = StressTestMetrics()
-    metrics.reset()
-    progress = ProgressBar(args.duration)
+    metrics.exemplars = ExemplarReservoir(
+        slowest=args.exemplars,
+        sample=args.exemplar_samples,
+        interval=args.exemplar_interval
+    )
+    progress = ProgressBar(
+        args.warmup + args.duration,
+        interval=args.progress_interval,
+        window=args.progress_window,
+        mode=args.progress,
+        stream=progress_stream
+    )
+    monitor = ClientMonitor(
+        metrics,
+        interval=args.monitor_interval,
+        lag_threshold=args.lag_threshold,
+        cpu_threshold=args.cpu_threshold
+    )
+    monitor_task = None
+    progress_task = None
+    warmup_task = None
+    resolver = None
+    tasks = []
+    gate = StartGate(1 if args.replay else args.threads)
+    setup = {'requested': 0, 'established': 0}
     
-    async def worker(url: str, headers: dict, data: dict):
+    async def end_warmup():
         try:
-            conn = aiohttp.TCPConnector(
-                limit=args.pool_size,
-                ttl_dns_cache=300,
-                force_close=False
-            )
+            await asyncio.sleep(args.warmup)
+        except asyncio.CancelledError:
+            metrics.abort_warmup()
+            raise
+        metrics.end_warmup()
+
+    async def worker(url: str, headers: dict, data: dict, index: int):
+        try:
+            conn = build_connector(args, index, resolver)
             
             timeout = aiohttp.ClientTimeout(total=args.timeout)
             
-            async with aiohttp.ClientSession(connector=conn, timeout=timeout) as session:
+            trace_configs = [build_trace_config()] if args.trace_connections else None
+            
+            async with aiohttp.ClientSession(connector=conn, timeout=timeout, trace_configs=trace_configs) as session:
+                # Workers send sequentially, so each one needs a single warm connection
+                if index < args.preconnect:
+                    setup['requested'] += 1
+                    established = await preconnect(session, url, 1)
+                    setup['established'] += established
+                await gate.wait()
+
                 while True:
                     try:
                         if args.delay > 0:
                             await asyncio.sleep(args.delay)
                             
-                        start_time = time.time()
-                        method = args.method.lower()
-                        
-                        async with getattr(session, method)(url, json=data, headers=headers) as response:
-                            await response.read()
-                            response_time = time.time() - start_time
-                            
-                            metrics.add_response_time(response_time)
-                            if response.status < 400:
-                                metrics.success_count += 1
-                            else:
-                                metrics.add_error(f"HTTP {response.status}")
+                        await timed_request(session, metrics, args.method, url, trace=args.trace_connections,
+                                            json=data, headers=headers)
                                 
                     except asyncio.CancelledError:
                         return
                     except Exception as e:
-                        metrics.add_error(type(e).__name__)
+                        metrics.add_error(error_name(e))
                         
-                    if time.time() - metrics.start_time > args.duration:
+                    if not metrics.in_warmup and metrics.get_duration() > args.duration:
                         return
-                    
-                    progress.update(metrics)
         except Exception as e:
             print(f"\nWorker error: {str(e)}")
+        finally:
+            gate.leave()
 
     try:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
+        warnings, errors = preflight(args)
+        for warning in warnings:
+            print(f"Warning: {warning}")
+        if errors:
+            for error in errors:
+                print(f"Error: {error}")
+            return None
+
+        if args.pin_dns:
+            resolver = PinnedResolver()
+            addresses = await resolver.pin(args.url)
+            print(f"Pinned {urlsplit(args.url).hostname} to {', '.join(addresses)}")
+
         headers = {'Content-Type': 'application/json'}
         data = {'stress_test': 'x' * args.payload_size}
         
-        tasks = [asyncio.create_task(worker(args.url, headers, data)) 
-                for _ in range(args.threads)]
+        setup_start = time.time()
+        if args.replay:
+            tasks = [asyncio.create_task(replay_log(args, metrics, gate, setup, resolver))]
+        else:
+            tasks = [asyncio.create_task(worker(args.url, headers, data, index)) 
+                    for index in range(args.threads)]
+
+        # Connection setup happens before the measurement clock starts
+        await gate.ready.wait()
+        if args.preconnect:
+            print(f"Pre-established {setup['established']}/{setup['requested']} connections "
+                  f"in {time.time() - setup_start:.2f}s")
+
+        metrics.reset()
+        for warning in warnings:
+            metrics.annotate(warning)
+        if setup['established'] < setup['requested']:
+            metrics.annotate(
+                f"Only {setup['established']} of {setup['requested']} connections could be pre-established"
+            )
+        metrics.in_warmup = args.warmup > 0
+        monitor_task = asyncio.create_task(monitor.run())
+        progress_task = asyncio.create_task(progress.run(metrics))
+        if args.warmup > 0:
+            warmup_task = asyncio.create_task(end_warmup())
+        gate.started.set()
         
         await asyncio.gather(*tasks)
+        # Freeze the clock before drain and reporting work can skew requests/sec
+        metrics.end_time = datetime.now()
+        progress.update(metrics)
         print("\nTest completed successfully")
         return metrics
         
     except GracefulExit:
         print("\nGracefully shutting down...")
+        metrics.end_time = datetime.now()
         for task in tasks:
             task.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
@@ -119,15 +602,35 @@ async def run_stress_test(args) -> Optional[StressTestMetrics]:
     except Exception as e:
         print(f"\nTest failed: {str(e)}")
         return None
+    finally:
+        monitor.stop()
+        progress.stop()
+        background = [task for task in (monitor_task, progress_task, warmup_task) if task]
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        if resolver:
+            await resolver.close()
 
 def save_metrics(metrics: StressTestMetrics, output_file: str):
     try:
+        duration = metrics.get_duration()
+        total_requests = metrics.success_count + metrics.error_count
         data = {
             'response_times': list(metrics.response_times),
+            'histogram': metrics.get_histogram(),
+            'duration': duration,
+            'requests_per_second': total_requests / duration if duration > 0 else 0,
             'success_count': metrics.success_count,
             'error_count': metrics.error_count,
             'percentiles': metrics.get_percentiles(),
             'error_types': metrics.error_types,
+            'time_series': list(metrics.time_series),
+            'client_health': metrics.get_client_health(),
+            'schedule_lag': metrics.get_schedule_lag(),
+            'exemplars': metrics.exemplars.get_exemplars(),
+            'warmup': metrics.warmup.get_summary() if metrics.warmup else None,
+            'annotations': metrics.annotations,
             'timestamp': datetime.now().isoformat()
         }
         
@@ -138,7 +641,186 @@ def save_metrics(metrics: StressTestMetrics, output_file: str):
     except Exception as e:
         print(f"\nFailed to save metrics: {str(e)}")
 
+def build_summary(metrics: StressTestMetrics) -> dict:
+    return {
+        'type': 'summary',
+        **metrics.get_summary(),
+        'warmup': metrics.warmup.get_summary() if metrics.warmup else None,
+        'client_health': metrics.get_client_health(),
+        'annotations': metrics.annotations
+    }
+
+def load_results(path: str) -> dict:
+    with open(path) as f:
+        results = json.load(f)
+    if 'histogram' not in results:
+        metrics = StressTestMetrics()
+        metrics.response_times.extend(results.get('response_times', []))
+        metrics.response_count = len(metrics.response_times)
+        results['histogram'] = metrics.get_histogram()
+    return results
+
+def merge_results(results: list) -> dict:
+    """Pools several runs (e.g. repeated baseline runs) into one comparable result."""
+    if len(results) == 1:
+        return results[0]
+    return {
+        'histogram': StressTestMetrics.merge_histograms(*(r['histogram'] for r in results)),
+        'requests_per_second': float(np.mean([result_throughput(r) for r in results])),
+        'time_series': [sample for r in results for sample in r.get('time_series', [])]
+    }
+
+def result_throughput(results: dict) -> float:
+    if results.get('requests_per_second'):
+        return results['requests_per_second']
+    values = interval_values(results, 'throughput')
+    return float(np.mean(values)) if values else 0
+
+def interval_values(results: dict, metric: str) -> list:
+    samples = [s for s in results.get('time_series', []) if s.get('interval') and not s.get('warmup')]
+    if metric == 'throughput':
+        return [s['requests'] / s['interval'] for s in samples]
+    return [s[metric] for s in samples if metric in s]
+
+def bootstrap_change(baseline: list, candidate: list, iterations: int, confidence: float,
+                     rng: np.random.Generator) -> Optional[tuple]:
+    """Confidence interval of the relative change (%) in the mean of per-interval samples."""
+    if len(baseline) < 2 or len(candidate) < 2:
+        return None
+    baseline_means = rng.choice(baseline, (iterations, len(baseline))).mean(axis=1)
+    candidate_means = rng.choice(candidate, (iterations, len(candidate))).mean(axis=1)
+    valid = baseline_means > 0
+    if not valid.any():
+        return None
+    changes = (candidate_means[valid] - baseline_means[valid]) / baseline_means[valid] * 100
+    alpha = (1 - confidence) / 2 * 100
+    low, high = np.percentile(changes, [alpha, 100 - alpha])
+    return float(low), float(high)
+
+def compare_results(baseline: dict, candidate: dict, args) -> list:
+    rng = np.random.default_rng(args.seed)
+    # (name, time series key, baseline, candidate, threshold %, higher_is_better)
+    rows = [(
+        'Requests/sec', 'throughput',
+        result_throughput(baseline), result_throughput(candidate),
+        args.max_throughput_drop,
+        True
+    )]
+    for p in args.percentiles:
+        rows.append((
+            f'P{p:g}', f'p{p:g}',
+            StressTestMetrics.histogram_percentile(baseline['histogram'], p),
+            StressTestMetrics.histogram_percentile(candidate['histogram'], p),
+            args.max_latency_increase,
+            False
+        ))
+
+    report = []
+    for name, metric, base_value, cand_value, threshold, higher_is_better in rows:
+        delta = (cand_value - base_value) / base_value * 100 if base_value else 0
+        ci = bootstrap_change(
+            interval_values(baseline, metric),
+            interval_values(candidate, metric),
+            args.bootstrap_iterations, args.confidence, rng
+        )
+        worse = delta < -threshold if higher_is_better else delta > threshold
+        if ci is None:
+            significant = None
+        else:
+            significant = ci[1] < 0 if higher_is_better else ci[0] > 0
+        report.append({
+            'metric': name,
+            'baseline': base_value,
+            'candidate': cand_value,
+            'delta_percent': delta,
+            'ci_percent': ci,
+            'significant': significant,
+            'threshold_percent': threshold,
+            'higher_is_better': higher_is_better,
+            'regression': worse and significant is True,
+            # Over the threshold, but without per-interval samples to test significance
+            'inconclusive': worse and significant is None
+        })
+    return report
+
+def format_comparison(report: list) -> str:
+    def value(row, key):
+        v = row[key]
+        return f"{v:.2f}" if row['metric'] == 'Requests/sec' else f"{v*1000:.2f}ms"
+
+    lines = []
+    for row in report:
+        if row['ci_percent']:
+            ci = f"[{row['ci_percent'][0]:+.1f}%, {row['ci_percent'][1]:+.1f}%]"
+        else:
+            ci = "n/a (not enough per-interval samples)"
+        status = "REGRESSION" if row['regression'] else "INCONCLUSIVE" if row['inconclusive'] else "ok"
+        lines.append(
+            f"{row['metric']}: {value(row, 'baseline')} -> {value(row, 'candidate')} "
+            f"({row['delta_percent']:+.1f}%, CI {ci}) {status}"
+        )
+    return f"""
+Comparison:
+==========
+{chr(10).join(lines)}
+"""
+
+def compare_main(argv: list):
+    parser = argparse.ArgumentParser(
+        prog='cli.py compare',
+        description='Compare Dark Vader result files and fail on performance regressions',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument('baseline', type=str, nargs='+',
+                        help='Baseline results file(s) (JSON); several files are merged into one baseline')
+    parser.add_argument('candidate', type=str, help='Candidate results file (JSON)')
+    parser.add_argument('--max-throughput-drop', type=validate_non_negative_float, default=5.0,
+                        help='Maximum allowed drop in requests/sec (percent)')
+    parser.add_argument('--max-latency-increase', type=validate_non_negative_float, default=10.0,
+                        help='Maximum allowed increase in any compared percentile (percent)')
+    parser.add_argument('--percentiles', type=validate_positive_float, nargs='+', default=[50, 95, 99],
+                        help='Percentiles to compare')
+    parser.add_argument('--confidence', type=float, default=0.95, help='Bootstrap confidence level')
+    parser.add_argument('--bootstrap-iterations', type=validate_positive, default=2000,
+                        help='Bootstrap resamples over per-interval samples')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible bootstrap')
+    parser.add_argument('--fail-on-inconclusive', action='store_true',
+                        help='Also fail when a threshold is exceeded but significance cannot be tested')
+    parser.add_argument('--output', type=str, help='Output file for the comparison report (JSON)')
+    args = parser.parse_args(argv)
+
+    if not 0 < args.confidence < 1:
+        parser.error("--confidence must be between 0 and 1")
+
+    try:
+        baseline = merge_results([load_results(path) for path in args.baseline])
+        report = compare_results(baseline, load_results(args.candidate), args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {str(e)}")
+        sys.exit(2)
+
+    print(format_comparison(report))
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    regressions = [row['metric'] for row in report if row['regression']]
+    inconclusive = [row['metric'] for row in report if row['inconclusive']]
+    if inconclusive:
+        print(f"Inconclusive (too few per-interval samples for a significance test): {', '.join(inconclusive)}")
+    if regressions:
+        print(f"Regression detected: {', '.join(regressions)}")
+        sys.exit(1)
+    if inconclusive and args.fail_on_inconclusive:
+        sys.exit(1)
+    print("No regressions detected")
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'compare':
+        compare_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description='Dark Vader CLI - HTTP Stress Testing Tool',
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -152,30 +834,88 @@ def main():
     parser.add_argument('--timeout', type=validate_positive, default=30, help='Request timeout (seconds)')
     parser.add_argument('--pool-size', type=validate_positive, default=100, help='Connection pool size')
     parser.add_argument('--output', type=str, help='Output file for metrics (JSON)')
+    parser.add_argument('--replay', type=str,
+                        help='Replay an access log (common/combined format or NDJSON, optionally .gz) against the URL as base')
+    parser.add_argument('--speed', type=validate_positive_float, default=1.0,
+                        help='Replay speed multiplier (2 replays twice as fast)')
+    parser.add_argument('--source-address', dest='source_addresses', action='append', metavar='IP',
+                        help='Local IP to bind outgoing connections to; repeat to spread connections across IPs')
+    parser.add_argument('--reuse-addr', action='store_true', help='Set SO_REUSEADDR on outgoing sockets')
+    parser.add_argument('--pin-dns', action='store_true',
+                        help='Resolve the target host once before the test and reuse the pinned addresses')
+    parser.add_argument('--exemplars', type=validate_non_negative, default=10,
+                        help='Slowest requests kept as exemplars per interval (0 disables)')
+    parser.add_argument('--exemplar-samples', type=validate_non_negative, default=5,
+                        help='Randomly sampled requests kept as exemplars per interval (0 disables)')
+    parser.add_argument('--exemplar-interval', type=validate_positive_float, default=10.0,
+                        help='Exemplar interval length (seconds)')
+    parser.add_argument('--trace-connections', action='store_true',
+                        help='Trace DNS/connect phases and connection reuse for exemplars (small per-request cost)')
+    parser.add_argument('--warmup', type=validate_non_negative_float, default=0,
+                        help='Warm-up period (seconds) before --duration starts; its samples are reported separately')
+    parser.add_argument('--preconnect', type=validate_non_negative, default=0,
+                        help='Connections to open and validate before the measurement clock starts '
+                             '(at most --threads unless replaying)')
+    parser.add_argument('--progress', choices=ProgressBar.MODES, default='bar',
+                        help='Progress output: terminal bar, NDJSON records on stdout for CI '
+                             '(other output goes to stderr), or none')
+    parser.add_argument('--progress-interval', type=validate_positive_float, default=0.5,
+                        help='Progress refresh interval (seconds)')
+    parser.add_argument('--progress-window', type=validate_positive_float, default=10.0,
+                        help='Rolling window for current req/s and P99 (seconds)')
+    parser.add_argument('--monitor-interval', type=validate_positive_float, default=1.0,
+                        help='Client self-monitoring sample interval (seconds)')
+    parser.add_argument('--lag-threshold', type=validate_non_negative_float, default=0.05,
+                        help='Event-loop lag (seconds) above which the client is considered saturated')
+    parser.add_argument('--cpu-threshold', type=validate_non_negative_float, default=90.0,
+                        help='Client CPU percent above which the client is considered saturated')
     
-    try:
-        args = parser.parse_args()
-        
-        if not validate_url(args.url):
-            print("Error: Invalid URL provided")
-            sys.exit(1)
+    args = parser.parse_args()
+    # Workers send sequentially, so each can keep only one warm connection
+    if not args.replay and args.preconnect > args.threads:
+        parser.error(f"--preconnect ({args.preconnect}) cannot exceed --threads ({args.threads})")
+
+    # In NDJSON mode stdout carries only machine-readable records; human output goes to stderr
+    progress_stream = sys.stdout
+    human_output = redirect_stdout(sys.stderr) if args.progress == 'ndjson' else nullcontext()
+    with human_output:
+        try:
+            if not validate_url(args.url):
+                print("Error: Invalid URL provided")
+                sys.exit(1)
             
-        print(f"Starting stress test against {args.url}")
-        print(f"Configuration: {args.threads} threads, {args.duration}s duration, {args.method} method")
+            if args.replay:
+                if not os.path.isfile(args.replay):
+                    print(f"Error: Log file not found: {args.replay}")
+                    sys.exit(1)
+                print(f"Replaying {args.replay} against {args.url}")
+                print(f"Configuration: {args.speed:g}x speed, {args.threads} max in-flight, {args.duration}s max duration")
+            else:
+                print(f"Starting stress test against {args.url}")
+                print(f"Configuration: {args.threads} threads, {args.duration}s duration, {args.method} method")
+            if args.warmup:
+                print(f"Warm-up: {args.warmup:g}s (reported separately)")
         
-        metrics = asyncio.run(run_stress_test(args))
+            metrics = asyncio.run(run_stress_test(args, progress_stream))
         
-        if metrics:
+            if metrics is None:
+                sys.exit(1)
+
             print(metrics.get_stats())
+            if metrics.exemplars.get_exemplars():
+                print(f"Slowest Requests:\n================\n{metrics.format_exemplars(5)}\n")
             if args.output:
                 save_metrics(metrics, args.output)
-                
-    except KeyboardInterrupt:
-        print("\nTest interrupted by user")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error: {str(e)}")
-        sys.exit(1)
+            if args.progress == 'ndjson':
+                progress_stream.write(json.dumps(build_summary(metrics)) + '\n')
+                progress_stream.flush()
+            
+        except KeyboardInterrupt:
+            print("\nTest interrupted by user")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            sys.exit(1)
 
 if __name__ == '__main__':
     main()
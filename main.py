@@ -1,46 +1,373 @@
 import customtkinter as ctk
-from tkinter import messagebox, ttk
+from tkinter import TclError, messagebox, ttk
 import threading
 import time
 from datetime import datetime
 from collections import deque
+from itertools import islice
 import statistics
 import asyncio
 import aiohttp
 from concurrent.futures import ThreadPoolExecutor
 import json
 import random
+import gc
+import heapq
+import math
+import os
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+class ExemplarReservoir:
+    """Keeps the slowest requests plus a uniform random sample per time interval.
+
+    Callers check `wants(response_time)` on every request, which only compares
+    against the current admission threshold; the exemplar itself is built and
+    stored only when it is accepted. The random sample uses reservoir sampling
+    with precomputed skips (Algorithm L), so no random numbers are drawn on the
+    hot path.
+    """
+
+    # Longest list get_slowest can return; completed intervals are merged into it on rotation
+    SLOWEST_KEPT = 100
+
+    def __init__(self, slowest: int = 10, sample: int = 5, interval: float = 10.0, max_intervals: int = 8640):
+        self.slowest = slowest
+        self.sample = sample
+        self.interval = interval
+        self.intervals = deque(maxlen=max_intervals)
+        self.interval_start = None
+        self._slowest: Optional[List[Dict[str, Any]]] = []
+        self._start_interval(time.time())
+
+    def _archive(self, summary: Dict[str, Any]):
+        if len(self.intervals) == self.intervals.maxlen and self._slowest:
+            evicted = {id(exemplar) for exemplar in self.intervals[0]['slowest']}
+            if any(id(exemplar) in evicted for exemplar in self._slowest):
+                self._slowest = None
+        self.intervals.append(summary)
+        if self._slowest is not None:
+            self._slowest = heapq.nlargest(self.SLOWEST_KEPT, self._slowest + summary['slowest'],
+                                           key=lambda e: e['response_time'])
+
+    def _start_interval(self, now: float):
+        if self.interval_start is not None and (self.heap or self.samples):
+            self._archive(self._summarize())
+        self.interval_start = now
+        self.heap = []
+        self.samples = []
+        self.seen = 0
+        self._counter = 0
+        self.threshold = -1.0 if self.slowest > 0 else math.inf
+        self.next_sample = 1 if self.sample > 0 else math.inf
+        self._weight = 1.0
+
+    def _summarize(self) -> Dict[str, Any]:
+        return {
+            'start': self.interval_start,
+            'requests': self.seen,
+            'slowest': [exemplar for _, _, exemplar in sorted(self.heap, key=lambda item: -item[0])],
+            'sample': list(self.samples)
+        }
+
+    def reset(self):
+        self.intervals.clear()
+        self._slowest = []
+        self.interval_start = None
+        self._start_interval(time.time())
+
+    def rotate(self, now: Optional[float] = None):
+        now = time.time() if now is None else now
+        if now - self.interval_start >= self.interval:
+            self._start_interval(now)
+
+    def wants(self, response_time: float) -> bool:
+        self.seen += 1
+        return response_time > self.threshold or self.seen >= self.next_sample
+
+    def add(self, response_time: float, exemplar: Dict[str, Any]):
+        if response_time > self.threshold:
+            self._counter += 1
+            item = (response_time, self._counter, exemplar)
+            if len(self.heap) < self.slowest:
+                heapq.heappush(self.heap, item)
+            else:
+                heapq.heapreplace(self.heap, item)
+            if len(self.heap) == self.slowest:
+                self.threshold = self.heap[0][0]
+
+        if self.seen >= self.next_sample:
+            if len(self.samples) < self.sample:
+                self.samples.append(exemplar)
+            else:
+                self.samples[random.randrange(self.sample)] = exemplar
+            if len(self.samples) == self.sample:
+                self._weight *= math.exp(math.log(1.0 - random.random()) / self.sample)
+                skip = math.floor(math.log(1.0 - random.random()) / math.log(1.0 - self._weight)) if self._weight < 1 else 0
+                self.next_sample = self.seen + skip + 1
+            else:
+                self.next_sample = self.seen + 1
+
+    def get_exemplars(self) -> List[Dict[str, Any]]:
+        intervals = list(self.intervals)
+        if self.heap or self.samples:
+            intervals.append(self._summarize())
+        return intervals
+
+    def get_slowest(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Slowest exemplars across all kept intervals, at most SLOWEST_KEPT."""
+        if self._slowest is None:
+            self._slowest = heapq.nlargest(
+                self.SLOWEST_KEPT,
+                (e for interval in list(self.intervals) for e in interval['slowest']),
+                key=lambda e: e['response_time']
+            )
+        current = [exemplar for _, _, exemplar in self.heap]
+        return heapq.nlargest(min(limit, self.SLOWEST_KEPT), self._slowest + current, key=lambda e: e['response_time'])
+
+def build_exemplar(method: str, url: str, status: int, start_time: float, headers_time: float,
+                   end_time: float, size: Optional[int], trace: Optional[dict]) -> dict:
+    phases = {}
+    reused = None
+    if trace is not None:
+        if 'dns_end' in trace:
+            phases['dns'] = trace['dns_end'] - trace['dns_start']
+        if 'connect_end' in trace:
+            phases['connect'] = trace['connect_end'] - trace['connect_start']
+        reused = 'reused' in trace
+    phases['headers'] = headers_time - start_time
+    phases['body'] = end_time - headers_time
+    return {
+        'timestamp': start_time,
+        'method': method,
+        'url': url,
+        'status': status,
+        'response_time': end_time - start_time,
+        'phases': phases,
+        'reused': reused,
+        'size': size
+    }
 
 class StressTestMetrics:
+    # Log-bucketed histogram layout; results sharing it can be merged by summing counts
+    HISTOGRAM_MIN = 1e-6
+    HISTOGRAM_GROWTH = 1.02
+
     def __init__(self):
         self.response_times = deque(maxlen=1000000)
+        self.response_count = 0
         self.success_count = 0
         self.error_count = 0
         self.start_time = None
+        self.end_time = None
         self.error_types: Dict[str, int] = {}
         self.percentiles = [50, 75, 90, 95, 99]
+        self.time_series = deque(maxlen=86400)
+        self.schedule_lags = deque(maxlen=1000000)
+        self.annotations: List[str] = []
+        self.exemplars = ExemplarReservoir()
+        self.in_warmup = False
+        self.warmup: Optional['StressTestMetrics'] = None
+        # Bumped whenever the request counters restart, so incremental readers can resync
+        self.epoch = 0
+        # Full-run histogram; samples are folded in periodically so it is not limited to the deque
+        self.histogram_counts: Dict[int, int] = {}
+        self.histogram_folded = 0
 
     def reset(self):
         self.response_times.clear()
+        self.response_count = 0
+        self.histogram_counts = {}
+        self.histogram_folded = 0
         self.success_count = 0
         self.error_count = 0
         self.error_types.clear()
+        self.time_series.clear()
+        self.schedule_lags.clear()
+        self.annotations.clear()
+        self.exemplars.reset()
+        self.in_warmup = False
+        self.warmup = None
+        self.epoch += 1
         self.start_time = datetime.now()
+        self.end_time = None
+
+    def end_warmup(self):
+        """Moves everything recorded so far into a separate warm-up bucket and restarts the clock.
+
+        The time series, annotations and schedule lags keep covering the whole run.
+        """
+        self.fold_histogram()
+        warmup = StressTestMetrics()
+        warmup.histogram_counts, self.histogram_counts = self.histogram_counts, {}
+        warmup.histogram_folded, self.histogram_folded = self.histogram_folded, 0
+        warmup.response_times, self.response_times = self.response_times, warmup.response_times
+        warmup.error_types, self.error_types = self.error_types, warmup.error_types
+        warmup.response_count = self.response_count
+        warmup.success_count = self.success_count
+        warmup.error_count = self.error_count
+        warmup.start_time = self.start_time
+        warmup.end_time = datetime.now()
+
+        self.response_count = 0
+        self.success_count = 0
+        self.error_count = 0
+        self.start_time = warmup.end_time
+        self.exemplars.reset()
+        self.in_warmup = False
+        self.warmup = warmup
+        self.epoch += 1
+
+    def abort_warmup(self):
+        """Flags a run that stopped before its warm-up ended; everything recorded is warm-up data."""
+        if self.in_warmup:
+            self.annotate("Stopped during warm-up; all results are warm-up only, not steady state")
+
+    def get_duration(self) -> float:
+        if not self.start_time:
+            return 0
+        return ((self.end_time or datetime.now()) - self.start_time).total_seconds()
+
+    def get_summary(self) -> Dict[str, Any]:
+        total_requests = self.success_count + self.error_count
+        duration = self.get_duration()
+        return {
+            'total_requests': total_requests,
+            'success_count': self.success_count,
+            'error_count': self.error_count,
+            'duration': duration,
+            'requests_per_second': total_requests / duration if duration > 0 else 0,
+            'avg_response_time': statistics.mean(self.response_times) if self.response_times else 0,
+            'percentiles': self.get_percentiles(),
+            'error_types': dict(self.error_types)
+        }
 
     def add_response_time(self, response_time: float):
         self.response_times.append(response_time)
+        self.response_count += 1
+
+    def recent_response_times(self, count: int) -> List[float]:
+        count = min(count, len(self.response_times))
+        return list(islice(reversed(self.response_times), count))
 
     def add_error(self, error_type: str):
         self.error_types[error_type] = self.error_types.get(error_type, 0) + 1
         self.error_count += 1
 
+    def add_schedule_lag(self, lag: float):
+        self.schedule_lags.append(lag)
+
+    def get_schedule_lag(self) -> Dict[str, float]:
+        if not self.schedule_lags:
+            return {}
+        lags = np.fromiter(self.schedule_lags, dtype=float)
+        return {
+            'mean': float(lags.mean()),
+            'p99': float(np.percentile(lags, 99)),
+            'max': float(lags.max())
+        }
+
+    def add_sample(self, sample: Dict[str, Any]):
+        self.time_series.append(sample)
+
+    def annotate(self, message: str):
+        if message not in self.annotations:
+            self.annotations.append(message)
+
+    def get_client_health(self) -> Dict[str, Any]:
+        samples = [s for s in self.time_series if 'loop_lag' in s]
+        if not samples:
+            return {}
+
+        def peak(key):
+            values = [s[key] for s in samples if s.get(key) is not None]
+            return max(values) if values else None
+
+        return {
+            'max_loop_lag': peak('loop_lag'),
+            'avg_cpu_percent': statistics.mean(s['cpu_percent'] for s in samples),
+            'peak_cpu_percent': peak('cpu_percent'),
+            'peak_rss_bytes': peak('rss_bytes'),
+            'gc_collections': samples[-1]['gc_collections'],
+            'gc_pause_total': samples[-1]['gc_pause_total'],
+            'peak_open_sockets': peak('open_sockets'),
+            'peak_pending_tasks': peak('pending_tasks'),
+            'saturated_samples': sum(1 for s in samples if s['saturated']),
+            'samples': len(samples)
+        }
+
     def get_percentiles(self) -> Dict[int, float]:
         if not self.response_times:
             return {p: 0 for p in self.percentiles}
         return {p: float(np.percentile(list(self.response_times), p)) for p in self.percentiles}
 
+    def fold_histogram(self, recent: Optional[List[float]] = None):
+        """Adds responses recorded since the last fold to the histogram.
+
+        Called on every ClientMonitor tick, so only responses that overflow the
+        deque between two ticks can be missed. Callers that already hold the
+        newest response times (newest first) can pass them as `recent`.
+        """
+        new = self.response_count - self.histogram_folded
+        if new > 0:
+            if recent is None or len(recent) < new:
+                recent = self.recent_response_times(new)
+            values = np.maximum(np.array(recent[:new], dtype=float), self.HISTOGRAM_MIN)
+            buckets = np.ceil(np.log(values / self.HISTOGRAM_MIN) / np.log(self.HISTOGRAM_GROWTH)).astype(int)
+            indices, totals = np.unique(buckets, return_counts=True)
+            for index, count in zip(indices, totals):
+                self.histogram_counts[int(index)] = self.histogram_counts.get(int(index), 0) + int(count)
+        self.histogram_folded = self.response_count
+
+    def get_histogram(self) -> Dict[str, Any]:
+        self.fold_histogram()
+        return {'min': self.HISTOGRAM_MIN, 'growth': self.HISTOGRAM_GROWTH, 'counts': dict(self.histogram_counts)}
+
+    @staticmethod
+    def merge_histograms(*histograms: Dict[str, Any]) -> Dict[str, Any]:
+        if not histograms:
+            raise ValueError("No histograms to merge")
+        layout = (histograms[0]['min'], histograms[0]['growth'])
+        counts: Dict[int, int] = {}
+        for histogram in histograms:
+            if (histogram['min'], histogram['growth']) != layout:
+                raise ValueError("Cannot merge histograms with different bucket layouts")
+            for index, count in histogram['counts'].items():
+                counts[int(index)] = counts.get(int(index), 0) + count
+        return {'min': layout[0], 'growth': layout[1], 'counts': counts}
+
+    @staticmethod
+    def histogram_percentile(histogram: Dict[str, Any], percentile: float) -> float:
+        counts = sorted((int(index), count) for index, count in histogram['counts'].items())
+        total = sum(count for _, count in counts)
+        if total == 0:
+            return 0
+        target = total * percentile / 100
+        cumulative = 0
+        for index, count in counts:
+            cumulative += count
+            if cumulative >= target:
+                return histogram['min'] * histogram['growth'] ** index
+        return histogram['min'] * histogram['growth'] ** counts[-1][0]
+
+    def format_exemplars(self, limit: int = 10) -> str:
+        lines = []
+        for e in self.exemplars.get_slowest(limit):
+            phases = ", ".join(f"{name} {value*1000:.1f}ms" for name, value in e['phases'].items())
+            reused = {True: "reused", False: "new conn"}.get(e['reused'], "conn n/a")
+            size = f"{e['size']}B" if e['size'] is not None else "n/a"
+            lines.append(
+                f"{datetime.fromtimestamp(e['timestamp']).strftime('%H:%M:%S')} "
+                f"{e['response_time']*1000:.1f}ms {e['method']} {e['url']} -> {e['status']} "
+                f"[{phases}] {reused}, {size}"
+            )
+        return "\n".join(lines) if lines else "No exemplars captured"
+
     def get_stats(self) -> str:
         if not self.response_times:
             return "No data available"
@@ -48,7 +375,7 @@ class StressTestMetrics:
         avg_response = statistics.mean(self.response_times) if self.response_times else 0
         total_requests = self.success_count + self.error_count
         success_rate = (self.success_count / total_requests * 100) if total_requests > 0 else 0
-        duration = (datetime.now() - self.start_time).total_seconds() if self.start_time else 0
+        duration = self.get_duration()
         requests_per_second = total_requests / duration if duration > 0 else 0
 
         percentiles = self.get_percentiles()
@@ -56,9 +383,58 @@ class StressTestMetrics:
 
         error_breakdown = "\n".join(f"{error}: {count}" for error, count in self.error_types.items())
 
+        health = self.get_client_health()
+        health_stats = ""
+        if health:
+            rss = f"{health['peak_rss_bytes']/1024/1024:.1f}MB" if health['peak_rss_bytes'] is not None else "n/a"
+            sockets = health['peak_open_sockets'] if health['peak_open_sockets'] is not None else "n/a"
+            health_stats = f"""
+Client Health:
+=============
+Max Loop Lag: {health['max_loop_lag']*1000:.2f}ms
+CPU: {health['avg_cpu_percent']:.1f}% avg, {health['peak_cpu_percent']:.1f}% peak
+Peak RSS: {rss}
+GC Collections: {health['gc_collections']} ({health['gc_pause_total']*1000:.2f}ms paused)
+Peak Open Sockets: {sockets}
+Peak Pending Tasks: {health['peak_pending_tasks']}
+Saturated Samples: {health['saturated_samples']}/{health['samples']}
+"""
+
+        schedule_lag = self.get_schedule_lag()
+        if schedule_lag:
+            health_stats += f"""
+Replay Schedule Lag:
+===================
+Mean: {schedule_lag['mean']*1000:.2f}ms
+P99: {schedule_lag['p99']*1000:.2f}ms
+Max: {schedule_lag['max']*1000:.2f}ms
+"""
+
+        title = "Performance Metrics:\n=================="
+        if self.in_warmup:
+            title = "Performance Metrics (warm-up only):\n================================="
+        warmup_stats = ""
+        if self.warmup:
+            title = "Performance Metrics (steady state):\n================================="
+            warmup = self.warmup.get_summary()
+            warmup_percentiles = ", ".join(
+                f"P{p}: {warmup['percentiles'][p]*1000:.2f}ms" for p in (50, 99) if p in warmup['percentiles']
+            )
+            warmup_stats = f"""
+Warm-up (excluded above):
+========================
+Duration: {warmup['duration']:.1f}s
+Requests/sec: {warmup['requests_per_second']:.2f}
+Avg Response Time: {warmup['avg_response_time']*1000:.2f}ms
+Total Requests: {warmup['total_requests']}
+Errors: {warmup['error_count']}
+{warmup_percentiles}
+"""
+
+        warnings = "".join(f"\nWARNING: {note}" for note in self.annotations)
+
         return f"""
-Performance Metrics:
-==================
+{title}
 Requests/sec: {requests_per_second:.2f}
 Avg Response Time: {avg_response*1000:.2f}ms
 Success Rate: {success_rate:.1f}%
@@ -73,8 +449,175 @@ Response Time Percentiles:
 Error Breakdown:
 ==============
 {error_breakdown}
+{warmup_stats}{health_stats}{warnings}
 """
 
+class ClientMonitor:
+    """Samples the load generator's own health into the metrics time series.
+
+    When the event loop lags behind its schedule or the process runs out of
+    CPU, reported latencies include client-side queueing. Such samples are
+    flagged as saturated and the test is annotated accordingly.
+    """
+
+    def __init__(self, metrics: StressTestMetrics, interval: float = 1.0,
+                 lag_threshold: float = 0.05, cpu_threshold: float = 90.0):
+        self.metrics = metrics
+        self.interval = interval
+        self.lag_threshold = lag_threshold
+        self.cpu_threshold = cpu_threshold
+        self.running = False
+        self.process = psutil.Process() if psutil else None
+        self.gc_collections = 0
+        self.gc_pause_total = 0.0
+        self._gc_started = None
+
+    def _gc_callback(self, phase: str, info: Dict[str, int]):
+        if phase == "start":
+            self._gc_started = time.perf_counter()
+        elif self._gc_started is not None:
+            self.gc_collections += 1
+            self.gc_pause_total += time.perf_counter() - self._gc_started
+            self._gc_started = None
+
+    def _rss_bytes(self) -> Optional[int]:
+        if self.process:
+            return self.process.memory_info().rss
+        try:
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _open_sockets(self) -> Optional[int]:
+        try:
+            fds = os.listdir('/proc/self/fd')
+        except OSError:
+            fds = None
+        if fds is not None:
+            count = 0
+            for fd in fds:
+                try:
+                    if os.readlink(f'/proc/self/fd/{fd}').startswith('socket:'):
+                        count += 1
+                except OSError:
+                    continue
+            return count
+        if self.process:
+            try:
+                return len(self.process.net_connections(kind='inet'))
+            except (AttributeError, psutil.Error):
+                return None
+        return None
+
+    def stop(self):
+        self.running = False
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        self.running = True
+        gc.callbacks.append(self._gc_callback)
+
+        last_wall = time.perf_counter()
+        last_cpu = time.process_time()
+        last_total = self.metrics.success_count + self.metrics.error_count
+        last_errors = self.metrics.error_count
+        last_responses = self.metrics.response_count
+        last_epoch = self.metrics.epoch
+
+        try:
+            while self.running:
+                scheduled = loop.time() + self.interval
+                await asyncio.sleep(self.interval)
+                loop_lag = max(0.0, loop.time() - scheduled)
+
+                # An interval that straddles a counter restart is partial; it is kept but flagged as warm-up
+                restarted = self.metrics.epoch != last_epoch
+                if restarted:
+                    last_total = last_errors = last_responses = 0
+                    last_epoch = self.metrics.epoch
+
+                # Scanning /proc/self/fd takes tens of ms with thousands of sockets; keep it off the loop
+                open_sockets = await loop.run_in_executor(None, self._open_sockets)
+
+                wall, cpu = time.perf_counter(), time.process_time()
+                cpu_percent = (cpu - last_cpu) / (wall - last_wall) * 100 if wall > last_wall else 0.0
+                total = self.metrics.success_count + self.metrics.error_count
+
+                sample = {
+                    'timestamp': time.time(),
+                    'interval': wall - last_wall,
+                    'requests': total - last_total,
+                    'errors': self.metrics.error_count - last_errors,
+                    'warmup': self.metrics.in_warmup or restarted,
+                    'loop_lag': loop_lag,
+                    'cpu_percent': cpu_percent,
+                    'rss_bytes': self._rss_bytes(),
+                    'gc_collections': self.gc_collections,
+                    'gc_pause_total': self.gc_pause_total,
+                    'open_sockets': open_sockets,
+                    'pending_tasks': len(asyncio.all_tasks(loop)),
+                }
+                # One copy of the newest response times serves both the interval percentiles and the histogram
+                unread = self.metrics.response_count - min(last_responses, self.metrics.histogram_folded)
+                recent = self.metrics.recent_response_times(unread)
+                latencies = recent[:self.metrics.response_count - last_responses]
+                if latencies:
+                    values = np.percentile(latencies, self.metrics.percentiles)
+                    sample.update({f'p{p}': float(v) for p, v in zip(self.metrics.percentiles, values)})
+                sample['saturated'] = loop_lag > self.lag_threshold or cpu_percent >= self.cpu_threshold
+                self.metrics.add_sample(sample)
+                self.metrics.exemplars.rotate()
+                self.metrics.fold_histogram(recent)
+
+                if sample['saturated']:
+                    self.metrics.annotate(
+                        "Client saturated (event-loop lag or CPU over threshold); "
+                        "reported latencies may reflect the load generator, not the server"
+                    )
+
+                last_wall, last_cpu = wall, cpu
+                last_total, last_errors = total, self.metrics.error_count
+                last_responses = self.metrics.response_count
+        finally:
+            gc.callbacks.remove(self._gc_callback)
+
+class StartGate:
+    """Holds workers after connection setup until the measurement clock starts."""
+
+    def __init__(self, parties: int):
+        self.parties = parties
+        self.arrived = 0
+        self.ready = asyncio.Event()
+        self.started = asyncio.Event()
+
+    def _arrive(self):
+        self.arrived += 1
+        if self.arrived >= self.parties:
+            self.ready.set()
+
+    async def wait(self):
+        self._arrive()
+        await self.started.wait()
+
+    def leave(self):
+        # Workers that fail during setup must not hold the others back
+        if not self.started.is_set():
+            self._arrive()
+
+async def preconnect(session: aiohttp.ClientSession, url: str, count: int) -> int:
+    """Opens up to `count` pooled connections with concurrent HEAD requests; returns how many were validated."""
+    async def probe() -> bool:
+        try:
+            async with session.head(url, allow_redirects=False) as response:
+                await response.read()
+            return True
+        except Exception:
+            return False
+
+    results = await asyncio.gather(*(probe() for _ in range(count)))
+    return sum(results)
+
 class LoadProfile:
     CONSTANT = "Constant"
     RAMP_UP = "Ramp Up"
@@ -130,6 +673,8 @@ class StressTester:
         self.retry_delay_var = ctk.DoubleVar(value=1.0)
         self.pool_size_var = ctk.IntVar(value=100)
         self.keep_alive_var = ctk.IntVar(value=300)
+        self.warmup_var = ctk.DoubleVar(value=0.0)
+        self.preconnect_var = ctk.IntVar(value=0)
 
         self.appearance_mode_var = ctk.StringVar(value="dark")
         self.color_theme_var = ctk.StringVar(value="blue")
@@ -282,6 +827,10 @@ class StressTester:
         self.metrics_display = ctk.CTkTextbox(top_frame, height=300)
         self.metrics_display.pack(fill="both", expand=True, padx=5, pady=5)
 
+        ctk.CTkLabel(top_frame, text="Slowest Requests").pack()
+        self.exemplar_display = ctk.CTkTextbox(top_frame, height=120)
+        self.exemplar_display.pack(fill="both", expand=True, padx=5, pady=5)
+
         # Bottom frame for export buttons and graph
         bottom_frame = ctk.CTkFrame(metrics_tab)
         bottom_frame.pack(fill="both", expand=True, padx=10, pady=5)
@@ -306,7 +855,11 @@ class StressTester:
             'success_count': self.metrics.success_count,
             'error_count': self.metrics.error_count,
             'percentiles': self.metrics.get_percentiles(),
-            'error_types': self.metrics.error_types
+            'error_types': self.metrics.error_types,
+            'time_series': list(self.metrics.time_series),
+            'client_health': self.metrics.get_client_health(),
+            'annotations': self.metrics.annotations,
+            'exemplars': self.metrics.exemplars.get_exemplars()
         }
 
         if format_type == "csv":
@@ -365,7 +918,9 @@ class StressTester:
             ("Pool Size:", self.pool_size_var, "10-1000"),
             ("Keep-Alive (s):", self.keep_alive_var, "60-600"),
             ("Retry Count:", self.retry_count_var, "0-10"),
-            ("Retry Delay (s):", self.retry_delay_var, "0.1-5.0")
+            ("Retry Delay (s):", self.retry_delay_var, "0.1-5.0"),
+            ("Warm-up (s):", self.warmup_var, "0-60"),
+            ("Pre-connect:", self.preconnect_var, "0-threads")
         ]
 
         for i, (label, var, placeholder) in enumerate(settings):
@@ -377,6 +932,8 @@ class StressTester:
         if self.stress_test_running:
             self.metrics_display.delete("1.0", "end")
             self.metrics_display.insert("1.0", self.metrics.get_stats())
+            self.exemplar_display.delete("1.0", "end")
+            self.exemplar_display.insert("1.0", self.metrics.format_exemplars())
         self.root.after(100, self.update_metrics_display)
 
     def log_message(self, message):
@@ -411,8 +968,10 @@ class StressTester:
                     headers=request_headers,
                     cookies=cookies
                 ) as response:
-                    await response.read()
-                    response_time = time.time() - start_time
+                    headers_time = time.time()
+                    body = await response.read()
+                    end_time = time.time()
+                    response_time = end_time - start_time
 
                     self.root.after(0, self.log_message, 
                                   f"Request completed in {response_time*1000:.2f}ms")
@@ -425,6 +984,11 @@ class StressTester:
                         self.metrics.add_error(error_msg)
                         self.log_message(error_msg)
 
+                    if self.metrics.exemplars.wants(response_time):
+                        self.metrics.exemplars.add(response_time, build_exemplar(
+                            method.upper(), url, response.status, start_time, headers_time, end_time, len(body), None
+                        ))
+
             except Exception as e:
                 error_type = type(e).__name__
                 self.metrics.add_error(error_type)
@@ -454,7 +1018,9 @@ class StressTester:
                 'retry_count': self.retry_count_var.get(),
                 'retry_delay': self.retry_delay_var.get(),
                 'pool_size': self.pool_size_var.get(),
-                'keep_alive': self.keep_alive_var.get()
+                'keep_alive': self.keep_alive_var.get(),
+                'warmup': self.warmup_var.get(),
+                'preconnect': self.preconnect_var.get()
             }
 
             filename = f"config_{self.config_name_var.get()}.json"
@@ -494,12 +1060,14 @@ class StressTester:
             self.retry_delay_var.set(config.get('retry_delay', 1.0))
             self.pool_size_var.set(config.get('pool_size', 100))
             self.keep_alive_var.set(config.get('keep_alive', 300))
+            self.warmup_var.set(config.get('warmup', 0.0))
+            self.preconnect_var.set(config.get('preconnect', 0))
 
             self.log_message(f"Configuration loaded from {filename}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load configuration: {str(e)}")
 
-    async def worker(self, url):
+    async def worker(self, url, index: int, gate: StartGate, setup: dict):
         conn = aiohttp.TCPConnector(
             limit=self.pool_size_var.get(),
             ttl_dns_cache=300,
@@ -516,27 +1084,59 @@ class StressTester:
 
         data = {'stress_test': 'x' * self.payload_size_var.get()}
 
-        async with aiohttp.ClientSession(
-            connector=conn, 
-            timeout=timeout,
-            trace_configs=None
-        ) as session:
-            while self.stress_test_running:
-                try:
-                    delay = float(self.request_delay_var.get())
-                    if delay > 0:
-                        await asyncio.sleep(delay)
-                    await self.make_request(session, url, headers, data)
-                except Exception as e:
-                    self.log_message(f"Worker error: {str(e)}")
-                    continue
+        try:
+            async with aiohttp.ClientSession(
+                connector=conn, 
+                timeout=timeout,
+                trace_configs=None
+            ) as session:
+                # Workers send sequentially, so each one needs a single warm connection
+                if index < self.preconnect_var.get():
+                    setup['requested'] += 1
+                    established = await preconnect(session, url, 1)
+                    setup['established'] += established
+                await gate.wait()
+
+                while self.stress_test_running:
+                    try:
+                        delay = float(self.request_delay_var.get())
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                        await self.make_request(session, url, headers, data)
+                    except Exception as e:
+                        self.log_message(f"Worker error: {str(e)}")
+                        continue
+        finally:
+            gate.leave()
+
+    async def start_measurement(self, gate: StartGate, setup: dict, warmup: float):
+        # Connection setup happens before the measurement clock starts
+        await gate.ready.wait()
+        if setup['requested']:
+            self.root.after(0, self.log_message,
+                            f"Pre-established {setup['established']}/{setup['requested']} connections")
+        self.metrics.reset()
+        self.metrics.in_warmup = warmup > 0
+        gate.started.set()
+
+        if warmup > 0:
+            try:
+                await asyncio.sleep(warmup)
+            except asyncio.CancelledError:
+                self.metrics.abort_warmup()
+                raise
+            self.metrics.end_warmup()
+            self.root.after(0, self.log_message, "Warm-up finished; measuring steady state")
 
     def run_async_loop(self, url):
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
         base_threads = self.num_threads_var.get()
+        warmup = self.warmup_var.get()
         start_time = time.time()
+        self.monitor = ClientMonitor(self.metrics)
+        monitor_task = loop.create_task(self.monitor.run())
 
         while self.stress_test_running:
             elapsed_time = time.time() - start_time
@@ -546,8 +1146,17 @@ class StressTester:
                 elapsed_time
             )
 
-            tasks = [loop.create_task(self.worker(url)) for _ in range(thread_count)]
+            gate = StartGate(thread_count)
+            setup = {'requested': 0, 'established': 0}
+            measure_task = loop.create_task(self.start_measurement(gate, setup, warmup))
+            tasks = [loop.create_task(self.worker(url, index, gate, setup)) for index in range(thread_count)]
             loop.run_until_complete(asyncio.gather(*tasks))
+            measure_task.cancel()
+            loop.run_until_complete(asyncio.gather(measure_task, return_exceptions=True))
+
+        self.monitor.stop()
+        monitor_task.cancel()
+        loop.run_until_complete(asyncio.gather(monitor_task, return_exceptions=True))
 
     def validate_inputs(self):
         if not self.url_var.get().strip():
@@ -562,6 +1171,13 @@ class StressTester:
             messagebox.showerror("Error", "Threads must be between 1 and 1000")
             return False
 
+        try:
+            if self.warmup_var.get() < 0 or not 0 <= self.preconnect_var.get() <= threads:
+                raise ValueError
+        except (ValueError, TclError):
+            messagebox.showerror("Error", "Warm-up must be non-negative and Pre-connect between 0 and the thread count")
+            return False
+
         return True
 
     def start_stress_test(self):
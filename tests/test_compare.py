@@ -0,0 +1,176 @@
+import argparse
+
+import numpy as np
+import pytest
+
+from cli import bootstrap_change, compare_results, merge_results
+from main import StressTestMetrics
+
+
+def make_results(rps: float, latency: float, intervals: int = 20, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    metrics = StressTestMetrics()
+    for value in latency * rng.uniform(0.9, 1.1, 2000):
+        metrics.add_response_time(float(value))
+    time_series = [
+        {
+            'interval': 1.0,
+            'requests': rps * rng.uniform(0.95, 1.05),
+            'p50': latency * rng.uniform(0.95, 1.05),
+            'p99': latency * 1.1 * rng.uniform(0.95, 1.05)
+        }
+        for _ in range(intervals)
+    ]
+    return {'histogram': metrics.get_histogram(), 'requests_per_second': rps, 'time_series': time_series}
+
+
+def make_args(**overrides) -> argparse.Namespace:
+    args = {
+        'max_throughput_drop': 5.0,
+        'max_latency_increase': 10.0,
+        'percentiles': [50, 99],
+        'confidence': 0.95,
+        'bootstrap_iterations': 500,
+        'seed': 1
+    }
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+def rows_by_metric(report: list) -> dict:
+    return {row['metric']: row for row in report}
+
+
+def test_histogram_percentile_returns_bucket_upper_bound():
+    metrics = StressTestMetrics()
+    for value in [0.010] * 90 + [0.100] * 10:
+        metrics.add_response_time(value)
+    histogram = metrics.get_histogram()
+
+    assert StressTestMetrics.histogram_percentile(histogram, 50) == pytest.approx(0.010, rel=0.02)
+    assert StressTestMetrics.histogram_percentile(histogram, 95) == pytest.approx(0.100, rel=0.02)
+    assert StressTestMetrics.histogram_percentile(histogram, 50) >= 0.010
+
+
+def test_histogram_percentile_empty_histogram():
+    assert StressTestMetrics.histogram_percentile(StressTestMetrics().get_histogram(), 99) == 0
+
+
+def test_histogram_percentile_accepts_json_string_keys():
+    histogram = StressTestMetrics().get_histogram()
+    histogram['counts'] = {'10': 1, '20': 3}
+
+    assert StressTestMetrics.histogram_percentile(histogram, 100) == pytest.approx(
+        histogram['min'] * histogram['growth'] ** 20
+    )
+
+
+def test_merge_histograms_sums_counts():
+    fast, slow = StressTestMetrics(), StressTestMetrics()
+    for _ in range(50):
+        fast.add_response_time(0.01)
+        slow.add_response_time(0.1)
+    merged = StressTestMetrics.merge_histograms(fast.get_histogram(), slow.get_histogram())
+
+    assert sum(merged['counts'].values()) == 100
+    assert StressTestMetrics.histogram_percentile(merged, 25) == pytest.approx(0.01, rel=0.02)
+    assert StressTestMetrics.histogram_percentile(merged, 75) == pytest.approx(0.1, rel=0.02)
+
+
+def test_merge_histograms_rejects_different_layouts():
+    histogram = StressTestMetrics().get_histogram()
+    with pytest.raises(ValueError):
+        StressTestMetrics.merge_histograms(histogram, dict(histogram, growth=1.5))
+
+
+def test_bootstrap_change_needs_two_samples_per_side():
+    rng = np.random.default_rng(0)
+    assert bootstrap_change([1.0], [1.0, 2.0], 100, 0.95, rng) is None
+
+
+def test_bootstrap_change_detects_shift():
+    rng = np.random.default_rng(0)
+    baseline = list(rng.normal(100, 2, 30))
+    candidate = list(rng.normal(120, 2, 30))
+
+    low, high = bootstrap_change(baseline, candidate, 1000, 0.95, rng)
+    assert 15 < low < high < 25
+
+
+def test_bootstrap_change_no_shift_includes_zero():
+    rng = np.random.default_rng(0)
+    samples = list(rng.normal(100, 2, 30))
+
+    low, high = bootstrap_change(samples, samples, 1000, 0.95, rng)
+    assert low < 0 < high
+
+
+def test_compare_flags_significant_throughput_drop():
+    report = rows_by_metric(compare_results(make_results(1000, 0.01), make_results(800, 0.01, seed=1), make_args()))
+
+    assert report['Requests/sec']['regression']
+    assert not report['P50']['regression']
+
+
+def test_compare_flags_significant_latency_increase():
+    report = rows_by_metric(compare_results(make_results(1000, 0.01), make_results(1000, 0.015, seed=1), make_args()))
+
+    assert report['P50']['regression']
+    assert report['P99']['regression']
+    assert not report['Requests/sec']['regression']
+
+
+@pytest.mark.parametrize('threshold', [0.0, 5.0])
+def test_compare_faster_throughput_passes(threshold):
+    report = rows_by_metric(compare_results(
+        make_results(1000, 0.01), make_results(4000, 0.01, seed=1), make_args(max_throughput_drop=threshold)
+    ))
+
+    assert not report['Requests/sec']['regression']
+    assert not report['Requests/sec']['inconclusive']
+
+
+@pytest.mark.parametrize('threshold', [0.0, 10.0])
+def test_compare_lower_latency_passes(threshold):
+    report = rows_by_metric(compare_results(
+        make_results(1000, 0.02), make_results(1000, 0.01, seed=1), make_args(max_latency_increase=threshold)
+    ))
+
+    assert not report['P50']['regression']
+    assert not report['P99']['regression']
+
+
+def test_compare_zero_threshold_catches_small_significant_drop():
+    report = rows_by_metric(compare_results(
+        make_results(1000, 0.01), make_results(900, 0.01, seed=1), make_args(max_throughput_drop=0.0)
+    ))
+
+    assert report['Requests/sec']['regression']
+
+
+def test_compare_without_intervals_is_inconclusive():
+    baseline = make_results(1000, 0.01, intervals=0)
+    candidate = make_results(500, 0.02, intervals=0, seed=1)
+    report = rows_by_metric(compare_results(baseline, candidate, make_args()))
+
+    for row in report.values():
+        assert row['ci_percent'] is None
+        assert row['inconclusive']
+        assert not row['regression']
+
+
+def test_compare_ignores_warmup_intervals():
+    baseline = make_results(1000, 0.01)
+    candidate = make_results(1000, 0.01, seed=1)
+    candidate['time_series'] += [{'interval': 1.0, 'requests': 10.0, 'warmup': True}] * 20
+    report = rows_by_metric(compare_results(baseline, candidate, make_args()))
+
+    assert not report['Requests/sec']['regression']
+
+
+def test_merge_results_pools_baselines():
+    merged = merge_results([make_results(1000, 0.01), make_results(2000, 0.01, seed=1)])
+
+    assert merged['requests_per_second'] == 1500
+    assert len(merged['time_series']) == 40
+    assert sum(merged['histogram']['counts'].values()) == 4000
@@ -0,0 +1,97 @@
+import random
+
+from main import ExemplarReservoir, build_exemplar
+
+
+def feed(reservoir: ExemplarReservoir, times: list, offset: int = 0):
+    for index, response_time in enumerate(times, offset):
+        if reservoir.wants(response_time):
+            reservoir.add(response_time, {'index': index, 'response_time': response_time})
+
+
+def test_keeps_slowest_per_interval():
+    reservoir = ExemplarReservoir(slowest=3, sample=0)
+    times = [float(t) for t in range(1000)]
+    random.Random(0).shuffle(times)
+    feed(reservoir, times)
+
+    slowest = reservoir.get_exemplars()[0]['slowest']
+    assert [e['response_time'] for e in slowest] == [999.0, 998.0, 997.0]
+    assert reservoir.get_exemplars()[0]['requests'] == 1000
+
+
+def test_threshold_rejects_requests_faster_than_kept_minimum():
+    reservoir = ExemplarReservoir(slowest=2, sample=0)
+    feed(reservoir, [5.0, 7.0])
+
+    assert reservoir.threshold == 5.0
+    assert not reservoir.wants(4.0)
+    assert reservoir.wants(6.0)
+
+
+def test_disabled_slowest_and_sample_keep_nothing():
+    reservoir = ExemplarReservoir(slowest=0, sample=0)
+    feed(reservoir, [float(t) for t in range(100)])
+
+    assert reservoir.get_exemplars() == []
+    assert reservoir.get_slowest() == []
+
+
+def test_sample_only_keeps_sample_size():
+    random.seed(0)
+    reservoir = ExemplarReservoir(slowest=0, sample=5)
+    feed(reservoir, [1.0] * 1000)
+
+    interval = reservoir.get_exemplars()[0]
+    assert interval['slowest'] == []
+    assert len(interval['sample']) == 5
+    assert len({e['index'] for e in interval['sample']}) == 5
+
+
+def test_sample_is_uniform():
+    random.seed(0)
+    trials, size, sample = 4000, 50, 5
+    counts = [0] * size
+    for _ in range(trials):
+        reservoir = ExemplarReservoir(slowest=0, sample=sample)
+        feed(reservoir, [1.0] * size)
+        for exemplar in reservoir.samples:
+            counts[exemplar['index']] += 1
+
+    expected = trials * sample / size
+    assert all(abs(count - expected) < expected * 0.25 for count in counts)
+
+
+def test_rotation_archives_interval_and_slowest_spans_intervals():
+    reservoir = ExemplarReservoir(slowest=2, sample=0, interval=10.0)
+    start = reservoir.interval_start
+    feed(reservoir, [1.0, 9.0, 3.0])
+    reservoir.rotate(start + 5)
+    assert len(reservoir.intervals) == 0
+
+    reservoir.rotate(start + 10)
+    feed(reservoir, [4.0, 2.0], offset=3)
+
+    assert len(reservoir.intervals) == 1
+    assert [e['response_time'] for e in reservoir.get_slowest(3)] == [9.0, 4.0, 3.0]
+
+
+def test_slowest_forgets_evicted_intervals():
+    reservoir = ExemplarReservoir(slowest=1, sample=0, interval=1.0, max_intervals=2)
+    now = reservoir.interval_start
+    for response_time in (9.0, 1.0, 2.0):
+        feed(reservoir, [response_time])
+        now += 1
+        reservoir.rotate(now)
+
+    assert [e['response_time'] for e in reservoir.get_slowest()] == [2.0, 1.0]
+
+
+def test_build_exemplar_phases():
+    trace = {'dns_start': 0.0, 'dns_end': 0.1, 'connect_start': 0.1, 'connect_end': 0.3}
+    exemplar = build_exemplar('GET', 'http://127.0.0.1/', 200, 0.0, 0.5, 0.75, 10, trace)
+
+    assert exemplar['response_time'] == 0.75
+    assert exemplar['reused'] is False
+    assert exemplar['phases'] == {'dns': 0.1, 'connect': 0.3 - 0.1, 'headers': 0.5, 'body': 0.25}
+    assert build_exemplar('GET', 'http://127.0.0.1/', 200, 0.0, 0.5, 0.75, 10, None)['reused'] is None
@@ -0,0 +1,36 @@
+from main import StressTestMetrics
+
+
+def test_end_warmup_splits_bucket_and_bumps_epoch():
+    metrics = StressTestMetrics()
+    metrics.reset()
+    epoch = metrics.epoch
+    for _ in range(10):
+        metrics.add_response_time(0.01)
+        metrics.success_count += 1
+    metrics.add_error("HTTP 500")
+
+    metrics.end_warmup()
+    metrics.add_response_time(0.02)
+    metrics.success_count += 1
+
+    assert metrics.epoch == epoch + 1
+    assert metrics.warmup.success_count == 10
+    assert metrics.warmup.error_types == {"HTTP 500": 1}
+    assert sum(metrics.warmup.get_histogram()['counts'].values()) == 10
+    assert metrics.success_count == 1
+    assert metrics.error_count == 0
+    assert sum(metrics.get_histogram()['counts'].values()) == 1
+
+
+def test_abort_warmup_labels_results_as_warmup_only():
+    metrics = StressTestMetrics()
+    metrics.reset()
+    metrics.in_warmup = True
+    metrics.add_response_time(0.01)
+    metrics.success_count += 1
+
+    metrics.abort_warmup()
+
+    assert metrics.annotations == ["Stopped during warm-up; all results are warm-up only, not steady state"]
+    assert metrics.get_stats().lstrip().startswith("Performance Metrics (warm-up only):")
@@ -0,0 +1,91 @@
+import gzip
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from cli import AccessLogReader
+
+CLF_LINE = '127.0.0.1 - - [10/Oct/2024:13:55:36 +0000] "GET /search?q=vader HTTP/1.1" 200 2326'
+COMBINED_LINE = CLF_LINE + ' "http://example.com/" "Mozilla/5.0"'
+TIMESTAMP = datetime(2024, 10, 10, 13, 55, 36, tzinfo=timezone.utc).timestamp()
+
+
+@pytest.fixture
+def reader():
+    return AccessLogReader('access.log')
+
+
+def test_parse_common_log_format(reader):
+    assert reader.parse_line(CLF_LINE) == {
+        'timestamp': TIMESTAMP,
+        'method': 'GET',
+        'headers': None,
+        'body': None,
+        'path': '/search?q=vader'
+    }
+
+
+def test_parse_combined_log_format(reader):
+    assert reader.parse_line(COMBINED_LINE)['path'] == '/search?q=vader'
+
+
+def test_parse_ndjson_path_and_epoch_timestamp(reader):
+    entry = reader.parse_line(json.dumps({
+        'timestamp': 1700000000.5, 'method': 'post', 'path': '/orders', 'headers': {'X-Test': '1'}, 'body': {'id': 1}
+    }))
+
+    assert entry == {
+        'timestamp': 1700000000.5,
+        'method': 'POST',
+        'headers': {'X-Test': '1'},
+        'body': {'id': 1},
+        'path': '/orders'
+    }
+
+
+def test_parse_ndjson_url_and_iso_timestamp(reader):
+    entry = reader.parse_line(json.dumps({'time': '2024-10-10T13:55:36+00:00', 'url': 'http://example.com/a?b=1'}))
+
+    assert entry['timestamp'] == TIMESTAMP
+    assert entry['method'] == 'GET'
+    assert entry['path'] == '/a?b=1'
+
+
+def test_parse_empty_path_defaults_to_root(reader):
+    assert reader.parse_line(json.dumps({'timestamp': 0, 'url': 'http://example.com'}))['path'] == '/'
+
+
+def test_parse_blank_and_unmatched_lines(reader):
+    assert reader.parse_line('   \n') is None
+    assert reader.parse_line('not a log line') is None
+
+
+def test_iteration_counts_skipped_lines(tmp_path):
+    path = tmp_path / 'access.log'
+    path.write_text('\n'.join([
+        CLF_LINE,
+        'garbage',
+        '',
+        '{"timestamp": 1, "method": "GET"}',
+        '{"timestamp": "not a date", "path": "/"}',
+        '{broken json',
+        json.dumps({'timestamp': 2, 'path': '/ok'})
+    ]) + '\n')
+
+    reader = AccessLogReader(str(path))
+    entries = list(reader)
+
+    assert [entry['path'] for entry in entries] == ['/search?q=vader', '/ok']
+    assert reader.skipped == 4
+
+
+def test_iteration_reads_gzip(tmp_path):
+    path = tmp_path / 'access.log.gz'
+    with gzip.open(path, 'wt') as f:
+        f.write(CLF_LINE + '\n' + COMBINED_LINE + '\n')
+
+    reader = AccessLogReader(str(path))
+
+    assert len(list(reader)) == 2
+    assert reader.skipped == 0